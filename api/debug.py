@@ -1,6 +1,7 @@
 from flask import Blueprint, jsonify, request, render_template
 import json
 import os
+from utils.mdns_utils import clear_resolve_cache
 
 debug_blueprint = Blueprint('debug', __name__)
 
@@ -58,4 +59,9 @@ def toggle_debug():
         debug_states[component] = enabled
         save_debug_states()  # Save on toggle
         return jsonify({"status": "success"})
-    return jsonify({"status": "failure", "error": "Invalid component or value"}), 400
\ No newline at end of file
+    return jsonify({"status": "failure", "error": "Invalid component or value"}), 400
+
+# Flush cached host resolutions, e.g. after a zone got a new address
+@debug_blueprint.route('/clear_resolve_cache', methods=['POST'])
+def clear_resolve_cache_endpoint():
+    return jsonify({"status": "success", "cleared": clear_resolve_cache()})
@@ -1,39 +1,16 @@
 from flask import Blueprint, jsonify, request, current_app
-from services.log_service import log_event
 from services.feeding_service import (
     start_feeding_sequence,
     stop_feeding_sequence,
     get_live_allow_remote_feeding,
+    log_feeding_feedback,
 )
 from utils.mdns_utils import standardize_host_ip
 from utils.settings_utils import load_settings
-from datetime import datetime
 import time
 
 feeding_blueprint = Blueprint('feeding', __name__)
 
-def log_feeding_feedback(message, plant_ip=None, status='info'):
-    """
-    Log feeding feedback to both the UI (via SocketIO) and feeding.jsonl.
-    
-    Args:
-        message (str): The feedback message to display and log.
-        plant_ip (str, optional): The IP of the plant, if applicable.
-        status (str): The status of the feedback ('info', 'success', 'error').
-    """
-    socketio = current_app.extensions['socketio']
-    log_data = {
-        'event_type': 'feeding_feedback',
-        'message': message,
-        'status': status,
-        'timestamp': datetime.now().isoformat()  # Add timestamp
-    }
-    if plant_ip:
-        log_data['plant_ip'] = plant_ip
-    
-    socketio.emit('feeding_feedback', log_data, namespace='/status')
-    log_event(log_data, category='feeding')
-
 @feeding_blueprint.route('/start', methods=['POST'])
 def start_feeding():
     data = request.get_json() or {}
@@ -1,6 +1,6 @@
 from flask import Blueprint, jsonify, request, current_app
 from datetime import datetime
-import requests
+from utils.http_utils import session as _session
 
 from services.log_service import log_event
 from utils.mdns_utils import standardize_host_ip
@@ -30,7 +30,7 @@ def log_plant_feedback(message, plant_ip=None, status='info'):
 def _cache_allow_remote_feeding(host, value):
     """Write the authoritative value straight into the cached plant payload so the
     UI and the feeding gate stop showing the pre-change value."""
-    with current_app.config['plant_lock']:
+    with current_app.config['plant_locks'][host]:
         entry = current_app.config['plant_data'].get(host)
         if entry is not None:
             entry.setdefault('settings', {})['allow_remote_feeding'] = value
@@ -68,7 +68,7 @@ def set_allow_remote_feeding():
         return jsonify({"status": "failure", "error": f"Cannot resolve {host}"}), 502
 
     try:
-        response = requests.post(
+        response = _session.post(
             f"http://{ip}:8000/api/plant_info/",
             json={"allow_remote_feeding": value},
             timeout=ZONE_TIMEOUT
@@ -141,7 +141,7 @@ def live_plant_settings(host):
         return jsonify({"status": "failure", "error": f"Cannot resolve {host}"}), 502
 
     try:
-        response = requests.get(f"http://{ip}:8000/api/settings/", timeout=ZONE_TIMEOUT)
+        response = _session.get(f"http://{ip}:8000/api/settings/", timeout=ZONE_TIMEOUT)
         response.raise_for_status()
         settings = response.json()
     except Exception as e:
@@ -191,7 +191,8 @@ def update_settings():
                     return jsonify({"status": "failure", "error": "Minimum flow rate must not exceed activation flow rate"}), 400
                 if drain_flow_settings['max_drain_time'] <= 0:
                     return jsonify({"status": "failure", "error": "Max drain time must be greater than 0"}), 400
-                settings['drain_flow_settings'] = drain_flow_settings
+                # Merge so keys the settings page doesn't edit (poll intervals) survive a save.
+                settings['drain_flow_settings'] = {**settings.get('drain_flow_settings', {}), **drain_flow_settings}
             else:
                 return jsonify({"status": "failure", "error": "Invalid drain flow settings"}), 400
 
@@ -6,6 +6,7 @@ from flask_socketio import SocketIO
 from flask_cors import CORS
 import socketio as sio_module
 from threading import Lock, Event
+from collections import defaultdict
 import time
 import socket
 from datetime import datetime
@@ -58,7 +59,10 @@ CORS(app)
 # Load settings into app.config for access via current_app.config['settings']
 app.config['settings'] = load_settings()
 app.config['plant_data'] = {}
+# plant_lock guards adding/removing plants; per-plant reads and writes use
+# plant_locks[host] so a slow handler for one zone never blocks another.
 app.config['plant_lock'] = Lock()
+app.config['plant_locks'] = defaultdict(Lock)
 app.config['plant_clients'] = {}
 app.config['reload_event'] = Event()
 app.config['debug_states'] = debug_states
@@ -112,12 +116,13 @@ set_feed_cf(calibration_factors.get('feed', 28.390575))
 set_drain_cf(calibration_factors.get('drain', 28.390575))
 
 # Pass app instance to feeding_service
-from services.feeding_service import initialize_feeding_service
+from services.feeding_service import initialize_feeding_service, notify_plant_update
 initialize_feeding_service(app, socketio)
 
 # Shared state for remote plants
 plant_data = app.config['plant_data']
 plant_lock = app.config['plant_lock']
+plant_locks = app.config['plant_locks']
 plant_clients = app.config['plant_clients']
 reload_event = app.config['reload_event']
 
@@ -187,12 +192,18 @@ def log_feeding_feedback(message, plant_ip=None, status='info'):
     socketio.emit('feeding_feedback', log_data, namespace='/status')
     log_event(log_data, category='feeding')
 
-def send_notification(alert_text: str):
+def send_notification(alert_text):
     """
     Send notification to Discord and/or Telegram if enabled.
-    Prepends the system name to the alert.
+    Prepends the system name to the alert. alert_text may be a zero-argument
+    callable, which is only called when something will consume the text.
     """
     settings = load_settings()
+    if not (settings.get("discord_enabled") or settings.get("telegram_enabled")
+            or debug_states.get('notifications', False)):
+        return
+    if callable(alert_text):
+        alert_text = alert_text()
     system_name = settings.get("system_name", "FlowMeter")
     final_alert = f"[{system_name}] {alert_text}"
 
@@ -286,7 +297,7 @@ def _do_connect(plant):
             # lines in feeding.jsonl on every restart and drowned real events.
             if debug_states.get('socket-connections', False):
                 print(f"[INFO] Connected to remote plant: {plant} at {ip}")
-            with plant_lock:
+            with plant_locks[plant]:
                 if plant in plant_data:
                     plant_data[plant]['is_online'] = True
         except Exception as e:
@@ -298,7 +309,7 @@ def _do_connect(plant):
             if debug_states.get('socket-connections', False):
                 print(f"[INFO] Disconnected from remote plant: {plant} at {ip}")
             log_feeding_feedback(f"Disconnected from remote plant: {plant} at {ip}", plant, status='info')
-            with plant_lock:
+            with plant_locks[plant]:
                 if plant in plant_data:
                     plant_data[plant]['last_update'] = None
                     plant_data[plant]['is_online'] = False
@@ -318,7 +329,7 @@ def _do_connect(plant):
             if debug_states.get('feeding', False):
                 print(f"[DEBUG] Feeding status from {plant}: in_progress={data.get('feeding_in_progress')}, "
                       f"allowed={data.get('settings', {}).get('allow_remote_feeding')}")
-            with plant_lock:
+            with plant_locks[plant]:
                 data['last_update'] = time.time() * 1000
                 data['ip'] = plant
                 data['system_name'] = data['settings'].get('system_name', plant)
@@ -326,6 +337,7 @@ def _do_connect(plant):
                 data['start_date'] = data['settings'].get('plant_info', {}).get('start_date', 'N/A')
                 data['is_online'] = True
                 plant_data[plant] = data
+            notify_plant_update(plant)
         except Exception as e:
             print(f"[ERROR] status_update handler failed for {plant}: {e}")
 
@@ -359,7 +371,7 @@ def retire_client(plant):
     """Drop a plant's client and cached data. Unregisters first so nothing can
     observe a half-torn-down client, then abandons the socket asynchronously."""
     client = plant_clients.pop(plant, None)
-    with plant_lock:
+    with plant_lock, plant_locks[plant]:
         plant_data.pop(plant, None)
     if client is not None:
         # The watchdog already logs why it is rebuilding; this would just repeat it.
@@ -528,23 +540,23 @@ def build_plants_payload():
     settings = load_settings()
     additional_plants = settings.get('additional_plants', [])
 
-    # Resolve names outside plant_lock - resolution can shell out to avahi and must
-    # never hold the lock every status handler needs.
+    # Resolve names before taking any lock - resolution can shell out to avahi and
+    # must never hold up the status handlers.
     resolved_ips = {plant: standardize_host_ip(plant) for plant in additional_plants}
 
-    with plant_lock:
-        aggregated = {'plants': []}
+    aggregated = {'plants': []}
 
-        for plant_ip in additional_plants:
-            resolved_ip = resolved_ips.get(plant_ip)
-            age = plant_age_seconds(plant_ip)
-            if age is None:
-                data_status = 'offline'
-            elif age <= PLANT_STALE_AFTER:
-                data_status = 'live'
-            else:
-                data_status = 'stale'
+    for plant_ip in additional_plants:
+        resolved_ip = resolved_ips.get(plant_ip)
+        age = plant_age_seconds(plant_ip)
+        if age is None:
+            data_status = 'offline'
+        elif age <= PLANT_STALE_AFTER:
+            data_status = 'live'
+        else:
+            data_status = 'stale'
 
+        with plant_locks[plant_ip]:
             if plant_ip in plant_data and plant_data[plant_ip].get('last_update'):
                 entry = plant_data[plant_ip]
                 entry['ip'] = resolved_ip or plant_ip
@@ -585,12 +597,12 @@ def build_plants_payload():
                     'original_host': plant_ip  # Add original_host
                 })
 
-        # Set is_currently_feeding based on current_plant_ip
-        current_plant = app.config.get('current_plant_ip')
-        for p in aggregated['plants']:
-            p['is_currently_feeding'] = p['original_host'] == current_plant
+    # Set is_currently_feeding based on current_plant_ip
+    current_plant = app.config.get('current_plant_ip')
+    for p in aggregated['plants']:
+        p['is_currently_feeding'] = p['original_host'] == current_plant
 
-        return aggregated
+    return aggregated
 
 
 def broadcast_plants_now():
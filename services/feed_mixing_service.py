@@ -1,22 +1,15 @@
 import time
-import requests
+from utils.http_utils import session as _session, parse_relay_response
 from flask import current_app
 from utils.settings_utils import load_settings
 from services.feed_flow_service import get_total_volume as get_feed_total_volume
 from services.log_service import log_event
-from .feeding_service import log_feeding_feedback, stop_feeding_flag, send_notification
+from .feeding_service import log_feeding_feedback, log_extended_feedback, is_feeding_stopped, send_notification, wait_for_feeding_sequence
 from .feed_pump_service import control_feed_pump
 import eventlet
 
-def log_extended_feedback(message, plant_ip=None, status='debug', sio=None):
-    """
-    Log extended feedback only if the 'feeding-extended-log' debug option is enabled.
-    Avoids circular import by accessing debug_states locally.
-    """
-    from app import debug_states
-    if debug_states.get('feeding-extended-log', False):
-        from .feeding_service import log_feeding_feedback
-        log_feeding_feedback(message, plant_ip, status, sio)
+# Longest the idle mixer parks between sequences before re-checking its state.
+MIXER_IDLE_RECHECK = 5
 
 def control_local_relay(relay_id, action, sio=None, plant_ip=None, status='info'):
     """
@@ -28,9 +21,9 @@ def control_local_relay(relay_id, action, sio=None, plant_ip=None, status='info'
     formatted_name = ' '.join(word.capitalize() for word in relay_name.replace('_', ' ').split()) + " Relay"
     url = f"http://127.0.0.1:8001/api/valve_relay/{relay_id}/{action}"
     try:
-        response = requests.post(url, timeout=5)
+        response = _session.post(url, timeout=5)
         response.raise_for_status()
-        data = response.json()
+        data = parse_relay_response(response)
         if data.get('status') == 'success':
             log_extended_feedback(f"Local {formatted_name} turned {action}", plant_ip, status, sio)
             return True
@@ -54,10 +47,16 @@ def monitor_feed_mixing(socketio, app):
     last_logged_reset = None  # Track the last reset key to avoid repeated logs
 
     while True:
+        # Between sequences there is nothing to mix: park until the next one starts
+        # rather than polling at 10Hz. A stop that left components on is still
+        # cleaned up first, and an active sequence returns from the wait at once.
+        if not mixed and (components_off or not is_feeding_stopped()):
+            wait_for_feeding_sequence(timeout=MIXER_IDLE_RECHECK)
+
         with app.app_context():  # Create application context
             current_plant_ip = app.config.get('current_plant_ip')
             plant_ip = current_plant_ip if current_plant_ip else last_processed_plant  # Use last_processed_plant if current_plant_ip is None
-            if stop_feeding_flag:
+            if is_feeding_stopped():
                 # Ensure components are off if sequence is stopped
                 if not components_off:
                     settings = load_settings()
@@ -95,7 +94,7 @@ def monitor_feed_mixing(socketio, app):
 
             if phase == 'fill' and plant_ip and not mixed and use_feed and not mixing_completed:
                 # Get system_volume from plant data
-                with app.config['plant_lock']:
+                with app.config['plant_locks'][plant_ip]:
                     system_volume = app.config['plant_data'].get(plant_ip, {}).get('settings', {}).get('system_volume', 0)
                 if system_volume == 0 or system_volume == 'N/A':
                     log_feeding_feedback(f"No valid system_volume for {plant_ip}, skipping mixing", plant_ip, 'warning', socketio)
@@ -162,14 +161,14 @@ def monitor_feed_mixing(socketio, app):
                         current_plant_ip = app.config.get('current_plant_ip')
                         plant_ip = current_plant_ip if current_plant_ip else last_processed_plant  # Use last_processed_plant if None
 
-                    if stop_feeding_flag or phase != 'fill':
+                    if is_feeding_stopped() or phase != 'fill':
                         # Turn off feed pump and relays on interruption or phase change
                         control_feed_pump(io_number=io_number, pump_type=pump_type, state=0, sio=socketio, plant_ip=plant_ip)
                         if feed_relay:
                             control_local_relay(feed_relay, 'off', socketio, plant_ip)
                         if fresh_relay:
                             control_local_relay(fresh_relay, 'off', socketio, plant_ip)
-                        if stop_feeding_flag:
+                        if is_feeding_stopped():
                             log_feeding_feedback(f"Feed mixing interrupted for {plant_ip}, turned off pump and relays", plant_ip, 'error', socketio)
                         else:
                             log_feeding_feedback(f"Fill phase completed for {plant_ip}, turned off feed pump and relays", plant_ip, 'info', socketio)
@@ -1,5 +1,5 @@
 import RPi.GPIO as GPIO
-import requests
+from utils.http_utils import session as _session
 from utils.settings_utils import load_settings
 from .feeding_service import log_feeding_feedback, send_notification
 
@@ -58,7 +58,7 @@ def control_feed_pump(io_number=None, pump_type='io', state=None, get_status=Fal
         elif pump_type == 'shelly':
             if get_status:
                 status_url = f"http://{ip}/relay/0"
-                response = requests.get(status_url, timeout=5)
+                response = _session.get(status_url, timeout=5)
                 response.raise_for_status()
                 data = response.json()
                 status = 1 if data.get('ison', False) else 0
@@ -71,7 +71,7 @@ def control_feed_pump(io_number=None, pump_type='io', state=None, get_status=Fal
                 return False
 
             url = f"http://{ip}/relay/0?turn={'on' if state == 1 else 'off'}"
-            response = requests.get(url, timeout=5)
+            response = _session.get(url, timeout=5)
             response.raise_for_status()
             action = 'ON' if state == 1 else 'OFF'
             log_feeding_feedback(f"Feed pump turned {action} on Shelly at {ip}", plant_ip, 'success', sio)
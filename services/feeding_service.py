@@ -1,9 +1,13 @@
 from flask import current_app
 import eventlet
-import requests
-from .log_service import log_event
+import eventlet.event
+import eventlet.queue
+import threading
+from contextlib import contextmanager
+from .log_service import queue_log_events
 from datetime import datetime
 from utils.mdns_utils import standardize_host_ip
+from utils.http_utils import session as _session, parse_relay_response
 import time
 from services.fresh_flow_service import get_latest_flow_rate as get_latest_fresh_flow_rate, get_total_volume as get_fresh_total_volume, reset_total as reset_fresh_total, flow_reader as fresh_flow_reader
 from services.feed_flow_service import get_latest_flow_rate as get_latest_feed_flow_rate, get_total_volume as get_feed_total_volume, reset_total as reset_feed_total, flow_reader as feed_flow_reader
@@ -21,19 +25,147 @@ from app import debug_states
 
 # Global flag to track if feeding should be stopped
 stop_feeding_flag = False
+# Set alongside stop_feeding_flag so the feeding loop's fixed pauses can wait on
+# it and return the moment a stop arrives instead of sleeping out the interval.
+_stop_event = threading.Event()
+# Set for the lifetime of a feeding sequence, so idle background loops (the feed
+# mixer) can park on it between sequences instead of polling.
+_sequence_active = threading.Event()
 
 # Global variables to be set during initialization
 _app = None
 _socketio = None
 
-# Shared variable to track drain completion
-drain_complete = {'status': False, 'reason': None}
+# Per-greenlet feedback buffer (threading.local is green under monkey_patch).
+# While a feedback_batch() block is open, log_feeding_feedback appends here and
+# the block sends everything as one emit and one log write when it exits.
+_feedback_batch = threading.local()
+
+# Feedback and the sequence's status events (_emit_status) go through one queue
+# drained by a background greenlet, so they reach the UI in the order they were
+# queued. Feedback queued within FEEDBACK_EMIT_INTERVAL is coalesced into a single
+# feeding_feedback_batch emit. Set the interval to 0 to emit inline.
+FEEDBACK_EMIT_INTERVAL = 0.1
+_emit_queue = eventlet.queue.LightQueue()
+_emitter = None
+
+# One-shot Events keyed by plant, fired by the status_update handler in app.py so
+# sensor/valve waiters wake as soon as the zone pushes new state.
+_update_events = {}
+_update_events_lock = threading.Lock()
+# Upper bound on one wait. stop_feeding_sequence wakes every waiter directly, so
+# this only bounds how stale the overall timeout check can get.
+WAIT_SLICE = 1
+# Per-tick debug lines are logged when their value changes, and otherwise only
+# every HEARTBEAT_TICKS ticks so a long wait can't flood feeding.jsonl.
+HEARTBEAT_TICKS = 10
+# Upper bound on zones stopped concurrently by stop_feeding_sequence.
+STOP_POOL_SIZE = 16
+
+# feeding_in_progress resets still in flight; start_feeding_sequence waits for
+# them before it reports the sequence finished.
+_pending_resets = []
+# app.config values for "no sequence running"; applied in one update() wherever a
+# sequence starts or ends.
+_IDLE_STATE = {'feeding_sequence_active': False, 'current_feeding_phase': 'idle', 'current_plant_ip': None}
+# Shared read-only default for nested payload lookups. Never mutate it.
+_EMPTY = {}
 
 def initialize_feeding_service(app_instance, socketio_instance):
     """Initialize the feeding service with the Flask app and SocketIO instances."""
-    global _app, _socketio
+    global _app, _socketio, _emitter
     _app = app_instance
     _socketio = socketio_instance
+    if FEEDBACK_EMIT_INTERVAL and _emitter is None:
+        _emitter = eventlet.spawn(_feedback_emitter)
+
+def _send_feedback(sio, entries):
+    if len(entries) == 1:
+        sio.emit('feeding_feedback', entries[0], namespace='/status')
+    else:
+        sio.emit('feeding_feedback_batch', entries, namespace='/status')
+
+def _emit_feedback(sio, entries):
+    """Hand feedback entries to the emitter greenlet, or emit inline if it isn't running."""
+    if _emitter is None:
+        _send_feedback(sio, entries)
+    else:
+        _emit_queue.put((sio, None, entries))
+
+def _emit_status(sio, event, data):
+    """
+    Emit a /status event such as feeding_plant_done. It goes through the emitter
+    queue too, so it can't overtake feedback lines queued before it.
+    """
+    if _emitter is None:
+        sio.emit(event, data, namespace='/status')
+    else:
+        _emit_queue.put((sio, event, data))
+
+def _feedback_emitter():
+    """
+    Drain _emit_queue in order. Feedback queued within one FEEDBACK_EMIT_INTERVAL
+    window is coalesced into one emit; a queued status event first flushes the
+    feedback ahead of it, then goes out as is.
+    """
+    while True:
+        items = [_emit_queue.get()]
+        if items[0][1] is None:
+            eventlet.sleep(FEEDBACK_EMIT_INTERVAL)
+        while not _emit_queue.empty():
+            items.append(_emit_queue.get_nowait())
+        feedback_sio, entries = None, []
+        try:
+            for sio, event, data in items:
+                if event is None:
+                    feedback_sio = sio
+                    entries.extend(data)
+                    continue
+                if entries:
+                    _send_feedback(feedback_sio, entries)
+                    entries = []
+                sio.emit(event, data, namespace='/status')
+            if entries:
+                _send_feedback(feedback_sio, entries)
+        except Exception as e:
+            print(f"[ERROR] Failed to emit feeding feedback: {e}")
+
+def notify_plant_update(plant_ip):
+    """Wake every waiter blocked on this plant's next status_update."""
+    with _update_events_lock:
+        evt = _update_events.pop(plant_ip, None)
+    if evt is not None:
+        evt.send()
+
+def _wake_all_waiters():
+    """Fire every pending update Event so blocked waiters re-check stop_feeding_flag now."""
+    with _update_events_lock:
+        events = list(_update_events.values())
+        _update_events.clear()
+    for evt in events:
+        evt.send()
+
+def is_feeding_stopped():
+    """Current stop_feeding_flag. Other modules must call this rather than import the
+    flag, since `from ... import stop_feeding_flag` copies the value at import time."""
+    return stop_feeding_flag
+
+def wait_for_feeding_sequence(timeout=None):
+    """Block until a feeding sequence is running (or timeout). Returns True if one is."""
+    return _sequence_active.wait(timeout)
+
+def _plant_update_event(plant_ip):
+    """Return the Event the next status_update for plant_ip will fire. Grab it
+    before reading plant_data so an update landing mid-read is not missed."""
+    with _update_events_lock:
+        evt = _update_events.get(plant_ip)
+        if evt is None:
+            evt = _update_events[plant_ip] = eventlet.event.Event()
+        return evt
+
+def _get_socketio(sio=None):
+    """Prefer an explicit instance, then the one bound at init; current_app is the last resort."""
+    return sio or _socketio or current_app.extensions.get('socketio')
 
 def get_live_allow_remote_feeding(plant_ip, timeout=5):
     """Read allow_remote_feeding straight from the zone over HTTP.
@@ -45,15 +177,16 @@ def get_live_allow_remote_feeding(plant_ip, timeout=5):
     if not resolved:
         return None, 'unresolvable_host'
     try:
-        response = requests.get(f"http://{resolved}:8000/api/settings/", timeout=timeout)
+        response = _session.get(f"http://{resolved}:8000/api/settings/", timeout=timeout)
         response.raise_for_status()
         settings = response.json()
     except Exception as e:
         return None, f'zone_unreachable: {e}'
 
     allowed = bool(settings.get('allow_remote_feeding'))
-    with current_app.config['plant_lock']:
-        entry = current_app.config['plant_data'].get(plant_ip)
+    config = current_app.config
+    with config['plant_locks'][plant_ip]:
+        entry = config['plant_data'].get(plant_ip)
         if entry is not None:
             entry.setdefault('settings', {})['allow_remote_feeding'] = allowed
     return allowed, None
@@ -76,8 +209,8 @@ def telemetry_is_fresh(plant_ip, wait_seconds=10):
         except Exception:
             pass
 
-    deadline = time.time() + wait_seconds
-    while time.time() < deadline:
+    deadline = time.monotonic() + wait_seconds
+    while time.monotonic() < deadline:
         current = (plant_data.get(plant_ip) or {}).get('last_update')
         if current and current != before:
             return True
@@ -101,44 +234,130 @@ def validate_feeding_allowed(plant_ip):
         return False, 'stale_telemetry'
     return True, 'ok'
 
+class _Lazy:
+    """Defer building a log message until something actually renders it."""
+    __slots__ = ('fn',)
+
+    def __init__(self, fn):
+        self.fn = fn
+
+    def __str__(self):
+        return self.fn()
+
 def log_feeding_feedback(message, plant_ip=None, status='info', sio=None):
     """
     Log feeding feedback to both the UI (via SocketIO) and feeding.jsonl.
     Use the provided socketio instance if available, otherwise fall back to global or current_app.
     """
-    sio = sio or _socketio or current_app.extensions.get('socketio')
+    sio = _get_socketio(sio)
     if not sio:
         print(f"[WARNING] SocketIO not available for logging: {message}")
         return
     log_data = {
         'event_type': 'feeding_feedback',
-        'message': message,
+        'message': str(message),
         'status': status,
         'timestamp': datetime.now().isoformat()
     }
     if plant_ip:
         log_data['plant_ip'] = plant_ip
-    
-    sio.emit('feeding_feedback', log_data, namespace='/status')
-    log_event(log_data, category='feeding')
+
+    entries = getattr(_feedback_batch, 'entries', None)
+    if entries is not None:
+        entries.append(log_data)
+        return
+    _emit_feedback(sio, [log_data])
+    queue_log_events([log_data], category='feeding')
+
+@contextmanager
+def feedback_batch(sio=None):
+    """
+    Collect feeding feedback for the duration of the block and flush it as a
+    single feeding_feedback_batch emit plus one feeding.jsonl write. Only wrap
+    bounded phases - nothing reaches the UI until the block exits. Nested
+    blocks join the outermost one.
+    """
+    if getattr(_feedback_batch, 'entries', None) is not None:
+        yield
+        return
+    _feedback_batch.entries = []
+    try:
+        yield
+    finally:
+        entries = _feedback_batch.entries
+        _feedback_batch.entries = None
+        if entries:
+            sio = _get_socketio(sio)
+            _emit_feedback(sio, entries)
+            queue_log_events(entries, category='feeding')
 
 def log_extended_feedback(message, plant_ip=None, status='debug', sio=None):
     """
     Log extended feedback only if the 'feeding-extended-log' debug option is enabled.
-    Avoids circular import by accessing debug_states locally.
+    debug_states is the module-level reference to app's dict, which is updated in
+    place, so the per-tick callers pay one dict lookup when the option is off.
     """
-    from app import debug_states
     if debug_states.get('feeding-extended-log', False):
-        from .feeding_service import log_feeding_feedback
         log_feeding_feedback(message, plant_ip, status, sio)
 
-def send_notification(alert_text: str):
+def send_notification(alert_text):
     """
-    Send notification to Discord and/or Telegram if enabled.
+    Send notification to Discord and/or Telegram if enabled. Pass a lambda for
+    long summaries so they are only built when a channel is enabled.
     """
     from app import send_notification as app_send_notification
     app_send_notification(alert_text)
 
+class _DrainResult:
+    """Outcome of one monitor_drain_conditions run, owned by the plant that started it."""
+    __slots__ = ('status', 'reason')
+
+    def __init__(self):
+        self.status = False
+        self.reason = None
+
+class _AbortPlant(Exception):
+    """
+    Raised inside the per-plant body of start_feeding_sequence to give up on the
+    current plant. The handler records the outcome, drops the plant from
+    remaining_plants and clears feeding_in_progress on the zone exactly once.
+    """
+    def __init__(self, summary, outcome='Failed', reason='error'):
+        super().__init__(summary)
+        self.summary = summary
+        self.outcome = outcome
+        self.reason = reason
+
+def _post_feeding_status(resolved_plant_ip, plant_ip, in_progress, sio=None, reason=None):
+    """Set or clear feeding_in_progress on a zone. Returns True on success."""
+    action = 'set' if in_progress else 'reset'
+    try:
+        response = _session.post(f"http://{resolved_plant_ip}:8000/api/settings/feeding_status", json={"in_progress": in_progress}, timeout=5)
+        response.raise_for_status()
+        suffix = f" due to {reason}" if reason else ""
+        log_extended_feedback(f"{action.capitalize()} feeding_in_progress for plant {plant_ip}{suffix}", plant_ip, status='info', sio=sio)
+        return True
+    except Exception as e:
+        log_feeding_feedback(f"Failed to {action} feeding_in_progress for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=sio)
+        send_notification(f"Failed to {action} feeding_in_progress for plant {plant_ip}: {str(e)}")
+        return False
+
+def _valve_status(entry, valve_label):
+    """A valve's status in one zone payload, or 'unknown'. Missing levels fall back
+    to the shared _EMPTY, so a miss allocates nothing."""
+    return entry.get('valve_info', _EMPTY).get('valve_relays', _EMPTY).get(valve_label, _EMPTY).get('status', 'unknown')
+
+def _reset_feeding_status_async(resolved_plant_ip, plant_ip, sio=None, reason=None):
+    """Clear feeding_in_progress on its own green thread so the sequence can move on
+    to the next plant without waiting on this zone's HTTP round trip."""
+    app = current_app._get_current_object()
+
+    def run():
+        with app.app_context():
+            _post_feeding_status(resolved_plant_ip, plant_ip, False, sio=sio, reason=reason)
+
+    _pending_resets.append(eventlet.spawn(run))
+
 def control_valve(plant_ip, valve_ip, valve_id, valve_label, action, sio=None, retries=2, timeout=15):
     """Control a valve (on/off) via the valve_relay API with retries."""
     resolved_valve_ip = standardize_host_ip(valve_ip)
@@ -146,19 +365,18 @@ def control_valve(plant_ip, valve_ip, valve_id, valve_label, action, sio=None, r
         log_feeding_feedback(f"Failed to resolve valve IP {valve_ip} for plant {plant_ip}", plant_ip, status='error', sio=sio)
         send_notification(f"Failed to resolve valve IP {valve_ip} for plant {plant_ip}")
         return False
-    # Check current valve status to avoid redundant calls
-    with current_app.config['plant_lock']:
-        plant_data = current_app.config['plant_data']
-        valve_status = plant_data.get(plant_ip, {}).get('valve_info', {}).get('valve_relays', {}).get(valve_label, {}).get('status', 'unknown')
-        if valve_status == action.lower():
-            log_extended_feedback(f"Valve {valve_label} already {action} for plant {plant_ip}, skipping control", plant_ip, status='info', sio=sio)
-            return True
+    # Check current valve status to avoid redundant calls. Lock-free: status_update
+    # replaces the whole payload, so this reads one consistent snapshot.
+    valve_status = _valve_status(current_app.config['plant_data'].get(plant_ip) or _EMPTY, valve_label)
+    if valve_status == action.lower():
+        log_extended_feedback(f"Valve {valve_label} already {action} for plant {plant_ip}, skipping control", plant_ip, status='info', sio=sio)
+        return True
     url = f"http://{resolved_valve_ip}:8000/api/valve_relay/{valve_id}/{action}"
     for attempt in range(retries):
         try:
-            response = requests.post(url, timeout=timeout)
+            response = _session.post(url, timeout=timeout)
             response.raise_for_status()
-            data = response.json()
+            data = parse_relay_response(response)
             if data.get('status') == 'success':
                 log_extended_feedback(f"Valve {valve_label} turned {action} for plant {plant_ip}", plant_ip, status='success', sio=sio)
                 return True
@@ -170,7 +388,7 @@ def control_valve(plant_ip, valve_ip, valve_id, valve_label, action, sio=None, r
             log_feeding_feedback(f"Error controlling valve {valve_label} for plant {plant_ip} (attempt {attempt+1}/{retries}): {str(e)}", plant_ip, status='error', sio=sio)
             if attempt < retries - 1:
                 log_extended_feedback(f"Retrying valve {valve_label} control for {plant_ip}", plant_ip, status='info', sio=sio)
-                time.sleep(2)
+                eventlet.sleep(2)
             else:
                 send_notification(f"Failed to control valve {valve_label} for plant {plant_ip} after {retries} attempts: {str(e)}")
                 return False
@@ -182,61 +400,87 @@ def wait_for_valve_off(plant_ip, valve_ip, valve_id, valve_label, timeout=10, si
         log_feeding_feedback(f"Failed to resolve valve IP {valve_ip} for plant {plant_ip}", plant_ip, status='error', sio=sio)
         send_notification(f"Failed to resolve valve IP {valve_ip} for plant {plant_ip}")
         return False
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    start_time = time.monotonic()
+    last_logged_status = None
+    tick = 0
+    plant_data = current_app.config['plant_data']
+    while time.monotonic() - start_time < timeout:
         if stop_feeding_flag:
             log_feeding_feedback(f"Feeding interrupted for plant {plant_ip}", plant_ip, status='error', sio=sio)
             send_notification(f"Feeding interrupted for plant {plant_ip}")
             return False
-        with current_app.config['plant_lock']:
-            plant_data = current_app.config['plant_data']
-            valve_status = plant_data.get(plant_ip, {}).get('valve_info', {}).get('valve_relays', {}).get(valve_label, {}).get('status', 'unknown')
-            log_extended_feedback(f"Checking valve {valve_label} status: {valve_status}", plant_ip, status='info', sio=sio)
-            if valve_status == 'off':
-                log_extended_feedback(f"Valve {valve_label} confirmed off for plant {plant_ip}", plant_ip, status='success', sio=sio)
-                return True
-        time.sleep(1)
+        update = _plant_update_event(plant_ip)
+        # Lock-free: see _sensor_reader.
+        valve_status = _valve_status(plant_data.get(plant_ip) or _EMPTY, valve_label)
+        if valve_status != last_logged_status or tick % HEARTBEAT_TICKS == 0:
+            log_extended_feedback(_Lazy(lambda: f"Checking valve {valve_label} status: {valve_status}"), plant_ip, status='info', sio=sio)
+            last_logged_status = valve_status
+        tick += 1
+        if valve_status == 'off':
+            log_extended_feedback(f"Valve {valve_label} confirmed off for plant {plant_ip}", plant_ip, status='success', sio=sio)
+            return True
+        update.wait(timeout=min(WAIT_SLICE, max(0, timeout - (time.monotonic() - start_time))))
     log_extended_feedback(f"Timeout waiting for valve {valve_label} to turn off for plant {plant_ip}", plant_ip, status='warning', sio=sio)
     send_notification(f"Timeout waiting for valve {valve_label} to turn off for plant {plant_ip}")
     return False
 
 def wait_for_sensor(plant_ip, sensor_key, expected_triggered, timeout=600, retries=2, sio=None):
     """Wait for a water level sensor to reach the expected triggered state, requiring a state change."""
-    with current_app.config['plant_lock']:
-        plant_data = current_app.config['plant_data']
-        sensor_label = plant_data.get(plant_ip, {}).get('water_level', {}).get(sensor_key, {}).get('label', sensor_key)
-        initial_triggered = plant_data.get(plant_ip, {}).get('water_level', {}).get(sensor_key, {}).get('triggered', 'unknown')
+    plant_data = current_app.config['plant_data']
+    read_triggered = _sensor_reader(plant_ip, sensor_key, 'unknown')
+    sensor_label = (plant_data.get(plant_ip) or {}).get('water_level', {}).get(sensor_key, {}).get('label', sensor_key)
+    initial_triggered = read_triggered()
     log_extended_feedback(f"Initial state for sensor {sensor_label} (triggered={initial_triggered}) for plant {plant_ip}", plant_ip, status='info', sio=sio)
 
     for attempt in range(retries):
         log_extended_feedback(f"Starting sensor wait for {sensor_label} (expected={expected_triggered}, attempt {attempt+1}/{retries}) for plant {plant_ip}", plant_ip, status='info', sio=sio)
-        start_time = time.time()
+        start_time = time.monotonic()
         state_changed = False
-        while time.time() - start_time < timeout:
+        while time.monotonic() - start_time < timeout:
             if stop_feeding_flag:
                 log_feeding_feedback(f"Feeding interrupted for plant {plant_ip}", plant_ip, status='error', sio=sio)
                 send_notification(f"Feeding interrupted for plant {plant_ip}")
                 return False
-            with current_app.config['plant_lock']:
-                plant_data = current_app.config['plant_data']
-                current_triggered = plant_data.get(plant_ip, {}).get('water_level', {}).get(sensor_key, {}).get('triggered', 'unknown')
-                if plant_ip in plant_data and current_triggered == expected_triggered and current_triggered != initial_triggered:
-                    state_changed = True
-                    log_extended_feedback(f"Sensor {sensor_label} reached expected state (triggered={expected_triggered}) after change from {initial_triggered} for plant {plant_ip}", plant_ip, status='success', sio=sio)
-                    return True
-            time.sleep(1)
+            update = _plant_update_event(plant_ip)
+            plant_known = plant_ip in plant_data
+            current_triggered = read_triggered()
+            if plant_known and current_triggered == expected_triggered and current_triggered != initial_triggered:
+                state_changed = True
+                log_extended_feedback(f"Sensor {sensor_label} reached expected state (triggered={expected_triggered}) after change from {initial_triggered} for plant {plant_ip}", plant_ip, status='success', sio=sio)
+                return True
+            update.wait(timeout=min(WAIT_SLICE, max(0, timeout - (time.monotonic() - start_time))))
         if not state_changed:
             log_extended_feedback(f"Timeout waiting for sensor {sensor_label} to change to triggered={expected_triggered} for plant {plant_ip} (attempt {attempt+1}/{retries})", plant_ip, status='warning', sio=sio)
             if attempt == retries - 1:
                 send_notification(f"Failed waiting for sensor {sensor_label} to change to triggered={expected_triggered} for plant {plant_ip} after {retries} attempts")
         if attempt < retries - 1:
-            time.sleep(5)
+            _stop_event.wait(5)
     log_extended_feedback(f"Failed waiting for sensor {sensor_label} to change to triggered={expected_triggered} for plant {plant_ip} after {retries} attempts", plant_ip, status='error', sio=sio)
     return False
 
-def monitor_drain_conditions(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, settings, sio, app):
-    """Monitor drain conditions until completion or timeout."""
-    global drain_complete, stop_feeding_flag
+def _sensor_reader(plant_ip, sensor_key, default):
+    """
+    Return a callable that reads sensor_key's triggered flag for plant_ip.
+    status_update replaces plant_data[plant_ip] wholesale, so the nested lookup is
+    redone only when that payload object changes rather than on every tick.
+    The same property makes the read safe without plant_locks: a reader sees
+    either the old payload or the new one, never a half-written mix. Per-tick
+    polls therefore never queue behind the status handler.
+    """
+    plant_data = current_app.config['plant_data']
+    cache = {'entry': None, 'sensor': {}}
+
+    def read():
+        entry = plant_data.get(plant_ip)
+        if entry is not cache['entry']:
+            cache['entry'] = entry
+            cache['sensor'] = (entry or _EMPTY).get('water_level', _EMPTY).get(sensor_key, _EMPTY)
+        return cache['sensor'].get('triggered', default)
+    return read
+
+def monitor_drain_conditions(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, settings, sio, app, drain_result, empty_sensor=None):
+    """Monitor drain conditions until completion or timeout, recording the outcome
+    on drain_result. Returns once the drain has finished, failed or been stopped."""
     with app.app_context():  # Ensure entire function runs in Flask context
         drain_settings = settings.get('drain_flow_settings', {})
         activation_delay = drain_settings.get('activation_delay', 5)
@@ -244,12 +488,21 @@ def monitor_drain_conditions(plant_ip, drain_valve_ip, drain_valve, drain_valve_
         min_flow_rate = drain_settings.get('min_flow_rate', 0.05)
         min_flow_check_delay = drain_settings.get('min_flow_check_delay', 30)
         max_drain_time = drain_settings.get('max_drain_time', 300)
+        # Poll fast while something is changing, back off while the drain is steady.
+        min_poll = drain_settings.get('min_poll_interval', 0.1)
+        max_poll = drain_settings.get('max_poll_interval', 1.0)
 
         # Verify empty sensor mapping
-        empty_sensor = settings.get('drain_sensor', 'sensor3')
+        empty_sensor = empty_sensor or settings.get('drain_sensor', 'sensor3')
+        read_empty_triggered = _sensor_reader(plant_ip, empty_sensor, False)
         log_extended_feedback(f"Empty sensor mapped to {empty_sensor} for {plant_ip}", plant_ip, 'info', sio)
 
-        eventlet.sleep(activation_delay)
+        if _stop_event.wait(activation_delay):
+            log_feeding_feedback(f"Feeding interrupted during drain activation delay for plant {plant_ip}", plant_ip, 'error', sio)
+            control_valve(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, 'off', sio=sio)
+            drain_result.status = False
+            drain_result.reason = 'interrupted'
+            return
 
         # Initial activation check: use ACCUMULATED drain volume (more robust
         # than an instantaneous flow sample). The required minimum volume is
@@ -265,27 +518,28 @@ def monitor_drain_conditions(plant_ip, drain_valve_ip, drain_valve, drain_valve_
             plant_ip, 'debug', sio)
         if initial_total is None and initial_flow is None:
             # Drain meter not reporting at all — fall back to the empty-sensor retry path
-            start_time = time.time()
-            while time.time() - start_time < 10:
-                with current_app.config['plant_lock']:
-                    plant_data = current_app.config['plant_data'].get(plant_ip, {})
-                    empty_triggered = plant_data.get('water_level', {}).get(empty_sensor, {}).get('triggered', False)
-                    log_extended_feedback(f"Empty sensor check on None flow for {plant_ip}: triggered={empty_triggered}", plant_ip, 'info', sio)
+            start_time = time.monotonic()
+            last_logged_empty = None
+            while time.monotonic() - start_time < 10:
+                empty_triggered = read_empty_triggered()
+                if empty_triggered != last_logged_empty:
+                    log_extended_feedback(_Lazy(lambda: f"Empty sensor check on None flow for {plant_ip}: triggered={empty_triggered}"), plant_ip, 'info', sio)
+                    last_logged_empty = empty_triggered
                 if not empty_triggered:
                     log_feeding_feedback(f"Empty sensor triggered on initial flow check for {plant_ip}, completing drain", plant_ip, 'success', sio)
                     if control_valve(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, 'off', sio=sio):
-                        drain_complete['status'] = True
-                        drain_complete['reason'] = 'sensor_triggered'
+                        drain_result.status = True
+                        drain_result.reason = 'sensor_triggered'
                     else:
-                        drain_complete['status'] = False
-                        drain_complete['reason'] = 'valve_off_failed'
+                        drain_result.status = False
+                        drain_result.reason = 'valve_off_failed'
                     return
-                time.sleep(1)
+                eventlet.sleep(1)
             log_feeding_feedback(f"Initial drain flow None and empty sensor not triggered for {plant_ip}, aborting drain", plant_ip, 'error', sio)
             send_notification(f"Drain activation flow check failed for {plant_ip}: no flow detected")
             control_valve(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, 'off', sio=sio)
-            drain_complete['status'] = False
-            drain_complete['reason'] = 'no_flow'
+            drain_result.status = False
+            drain_result.reason = 'no_flow'
             return
         elif (initial_total or 0) < min_initial_volume:
             log_feeding_feedback(
@@ -295,347 +549,236 @@ def monitor_drain_conditions(plant_ip, drain_valve_ip, drain_valve, drain_valve_
                 plant_ip, 'warning', sio)
             send_notification(f"Initial drain volume low for {plant_ip}, considering empty")
             control_valve(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, 'off', sio=sio)
-            drain_complete['status'] = True
-            drain_complete['reason'] = 'low_initial_volume'
+            drain_result.status = True
+            drain_result.reason = 'low_initial_volume'
             return
 
         log_extended_feedback(f"Starting flow monitoring for {plant_ip} after activation delay of {activation_delay}s", plant_ip, 'info', sio)
 
-        start_time = time.time()  # Start timeout clock after activation delay
+        start_time = time.monotonic()  # Start timeout clock after activation delay
         low_flow_start = None
+        interval = min_poll
+        tick = 0
+        last_logged_empty = None
+        last_logged_flow = None
 
         while True:
+            heartbeat = tick % HEARTBEAT_TICKS == 0
+            tick += 1
+            update = _plant_update_event(plant_ip)
             # Check empty sensor first to align with remote system's stop
-            with current_app.config['plant_lock']:
-                plant_data = current_app.config['plant_data'].get(plant_ip, {})
-                empty_triggered = plant_data.get('water_level', {}).get(empty_sensor, {}).get('triggered', False)
-                log_extended_feedback(f"Empty sensor check for {plant_ip}: triggered={empty_triggered}", plant_ip, 'info', sio)
+            empty_triggered = read_empty_triggered()
+            # Per-tick messages below run at up to 10Hz; _Lazy skips the formatting
+            # entirely unless extended logging is on, and each is change/heartbeat gated.
+            if empty_triggered != last_logged_empty or heartbeat:
+                log_extended_feedback(_Lazy(lambda: f"Empty sensor check for {plant_ip}: triggered={empty_triggered}"), plant_ip, 'info', sio)
+                last_logged_empty = empty_triggered
 
             if not empty_triggered:
                 log_feeding_feedback(f"Empty sensor triggered during drain conditions monitoring for {plant_ip}, completing drain", plant_ip, 'success', sio)
                 if control_valve(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, 'off', sio=sio):
-                    drain_complete['status'] = True
-                    drain_complete['reason'] = 'sensor_triggered'
+                    drain_result.status = True
+                    drain_result.reason = 'sensor_triggered'
                 else:
-                    drain_complete['status'] = False
-                    drain_complete['reason'] = 'valve_off_failed'
+                    drain_result.status = False
+                    drain_result.reason = 'valve_off_failed'
                 return
 
             if stop_feeding_flag:
                 log_feeding_feedback(f"Feeding interrupted during drain conditions monitoring for plant {plant_ip}", plant_ip, 'error', sio)
                 control_valve(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, 'off', sio=sio)
-                drain_complete['status'] = False
-                drain_complete['reason'] = 'interrupted'
+                drain_result.status = False
+                drain_result.reason = 'interrupted'
                 break
 
-            elapsed = time.time() - start_time
-            log_extended_feedback(f"Drain monitoring loop: elapsed={elapsed:.2f}s, max={max_drain_time}s", plant_ip, 'debug', sio)
+            now = time.monotonic()
+            elapsed = now - start_time
+            if heartbeat:
+                log_extended_feedback(_Lazy(lambda: f"Drain monitoring loop: elapsed={elapsed:.2f}s, max={max_drain_time}s"), plant_ip, 'debug', sio)
 
             # Enforce max_drain_time
             if elapsed > max_drain_time:
                 log_feeding_feedback(f"Max drain time {max_drain_time}s reached for {plant_ip}, completing drain", plant_ip, 'warning', sio)
                 send_notification(f"Max drain time reached for {plant_ip} during feeding")
                 control_valve(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, 'off', sio=sio)
-                drain_complete['status'] = True
-                drain_complete['reason'] = 'timeout'
+                drain_result.status = True
+                drain_result.reason = 'timeout'
                 break
 
             # Check low flow, treating None as 0
             current_flow = get_latest_drain_flow_rate()
             effective_flow = current_flow if current_flow is not None else 0.0
-            log_extended_feedback(f"Current drain flow: {effective_flow}, min={min_flow_rate}, low_flow_start={low_flow_start}", plant_ip, 'debug', sio)
+            if last_logged_flow is None or abs(effective_flow - last_logged_flow) > 0.05 or heartbeat:
+                log_extended_feedback(_Lazy(lambda: f"Current drain flow: {effective_flow}, min={min_flow_rate}, low_flow_start={low_flow_start}"), plant_ip, 'debug', sio)
+                last_logged_flow = effective_flow
             if effective_flow < min_flow_rate:
                 if low_flow_start is None:
-                    low_flow_start = time.time()
+                    low_flow_start = now
+                    interval = min_poll
                     log_extended_feedback(f"Low flow started at {low_flow_start}", plant_ip, 'debug', sio)
-                low_flow_duration = time.time() - low_flow_start
-                log_extended_feedback(f"Low flow duration: {low_flow_duration:.2f}s, min={min_flow_check_delay}s", plant_ip, 'debug', sio)
+                low_flow_duration = now - low_flow_start
+                if heartbeat:
+                    log_extended_feedback(_Lazy(lambda: f"Low flow duration: {low_flow_duration:.2f}s, min={min_flow_check_delay}s"), plant_ip, 'debug', sio)
                 if low_flow_duration >= min_flow_check_delay:
                     log_feeding_feedback(f"Drain flow dropped below {min_flow_rate} Gal/min for {min_flow_check_delay}s after monitoring started, considering bucket empty and proceeding to fill", plant_ip, 'warning', sio)
                     send_notification(f"Low drain flow detected for {plant_ip} during feeding")
                     control_valve(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, 'off', sio=sio)
-                    drain_complete['status'] = True
-                    drain_complete['reason'] = 'low_flow'
+                    drain_result.status = True
+                    drain_result.reason = 'low_flow'
                     break
             else:
                 if low_flow_start is not None:
                     log_extended_feedback(f"Flow recovered above threshold, resetting low_flow_start", plant_ip, 'debug', sio)
                     low_flow_start = None
+                    interval = min_poll
 
-            eventlet.sleep(0.1)  # Tighter loop for responsiveness
-
-def start_feeding_sequence(use_fresh=True, use_feed=True, sio=None):
-    global stop_feeding_flag, drain_complete
-    drain_complete = {'status': False, 'reason': None}  # Reset at start
-    stop_feeding_flag = False
-    with current_app.app_context():
-        current_app.config['feeding_sequence_active'] = True
-        current_app.config['current_feeding_phase'] = 'idle'
-        current_app.config['current_plant_ip'] = None
-        log_extended_feedback(f"Set feeding_sequence_active to True", status='debug')
-    socketio_instance = sio or _socketio or current_app.extensions.get('socketio')
-    socketio_instance.emit('feeding_sequence_state', {'active': True}, namespace='/status')
-
-    settings = load_settings()
-    nutrient_concentration = settings.get('nutrient_concentration', 3)
-    print(f"[DEBUG] Loaded nutrient_concentration: {nutrient_concentration}")
-    
-    additional_plants = settings.get('additional_plants', [])
-    log_feeding_feedback(f"Starting feeding sequence with use_fresh={use_fresh}, use_feed={use_feed}. Plants: {additional_plants}", status='info', sio=socketio_instance)
+            # A status_update from the zone (e.g. the Empty sensor flipping) ends the
+            # wait early and snaps back to the fast interval.
+            update.wait(timeout=interval)
+            interval = min_poll if update.ready() else min(max_poll, interval * 1.3)
 
-    remaining_plants = list(additional_plants)
-    completed_plants = []
-    message = []
-    had_empty = False
+def _feed_one_plant(plant_ip, settings, socketio_instance, message, remaining_plants, completed_plants):
+    """
+    Run drain then fill for one plant. Outcomes are recorded into the caller's
+    message/completed_plants lists and remaining_plants ordered dict. Returns True
+    only when the plant completed its full cycle. Every exit, including a skip
+    or a failed setup, emits one feeding_plant_done.
+
+    Plants are fed one at a time on purpose: the fresh/feed/drain flow meters,
+    the feed mixer and current_plant_ip are shared by every zone, so two plants
+    in flight would corrupt each other's totals and mixing.
+    """
+    config = current_app.config
+    plant_data = config['plant_data']
 
-    for plant_ip in additional_plants:
-        reset_fresh_total()
-        reset_feed_total()
-        reset_drain_total()
-        log_extended_feedback(f"Reset all total volumes for plant {plant_ip}", plant_ip, status='info', sio=socketio_instance)
+    # Sensor keys come from settings, not from the zone payload; no lookup needed per read.
+    empty_sensor = settings.get('drain_sensor', 'sensor3')  # Assuming default
+    full_sensor = settings.get('fill_sensor', 'sensor1')    # Assuming default
 
-        if stop_feeding_flag:
-            log_feeding_feedback(f"Stopping sequence early due to interruption. Completed: {', '.join(completed_plants) if completed_plants else 'None'}. Remaining: {', '.join(remaining_plants) if remaining_plants else 'None'}", status='error', sio=socketio_instance)
-            send_notification(f"Stopping sequence early due to interruption. Completed: {', '.join(completed_plants) if completed_plants else 'None'}. Remaining: {', '.join(remaining_plants) if remaining_plants else 'None'}")
-            break
+    resolved_plant_ip = None
+    outcome = 'failed'
+    try:
+        # Setup is a bounded phase: batch its feedback. The drain and fill phases below
+        # block on valve calls and waits, so their lines go out as they are logged
+        # (the emitter still coalesces them) and the dashboard stays live.
+        with feedback_batch(socketio_instance):
+            reset_fresh_total()
+            reset_feed_total()
+            reset_drain_total()
+            log_extended_feedback(f"Reset all total volumes for plant {plant_ip}", plant_ip, status='info', sio=socketio_instance)
 
-        resolved_plant_ip = standardize_host_ip(plant_ip)
-        if not resolved_plant_ip:
-            log_feeding_feedback(f"Failed to resolve plant IP {plant_ip}", plant_ip, status='error', sio=socketio_instance)
-            send_notification(f"Failed to resolve plant IP {plant_ip}")
-            message.append(f"Failed {plant_ip}: Resolution error")
-            if plant_ip in remaining_plants:
-                remaining_plants.remove(plant_ip)
-            continue
+            resolved_plant_ip = standardize_host_ip(plant_ip)
+            if not resolved_plant_ip:
+                log_feeding_feedback(f"Failed to resolve plant IP {plant_ip}", plant_ip, status='error', sio=socketio_instance)
+                send_notification(f"Failed to resolve plant IP {plant_ip}")
+                message.append(f"Failed {plant_ip}: Resolution error")
+                remaining_plants.pop(plant_ip, None)
+                return False
 
-        allowed, reason = validate_feeding_allowed(plant_ip)
-        if not allowed:
-            log_feeding_feedback(f"Skipping plant {plant_ip}: {reason}", plant_ip, status='warning', sio=socketio_instance)
-            if reason != 'remote_feeding_disabled':
-                send_notification(f"Skipped {plant_ip} during feeding sequence: {reason}")
-            message.append(f"Skipped {plant_ip}: {reason}")
-            if plant_ip in remaining_plants:
-                remaining_plants.remove(plant_ip)
-            continue
+            allowed, reason = validate_feeding_allowed(plant_ip)
+            if not allowed:
+                log_feeding_feedback(f"Skipping plant {plant_ip}: {reason}", plant_ip, status='warning', sio=socketio_instance)
+                if reason != 'remote_feeding_disabled':
+                    send_notification(f"Skipped {plant_ip} during feeding sequence: {reason}")
+                outcome = 'skipped'
+                message.append(f"Skipped {plant_ip}: {reason}")
+                remaining_plants.pop(plant_ip, None)
+                return False
 
-        with current_app.app_context():
-            current_app.config['current_feeding_phase'] = 'drain'
-            current_app.config['current_plant_ip'] = plant_ip
+            config['current_feeding_phase'] = 'drain'
+            config['current_plant_ip'] = plant_ip
 
-        try:
-            response = requests.post(f"http://{resolved_plant_ip}:8000/api/settings/feeding_status", json={"in_progress": True}, timeout=5)
-            response.raise_for_status()
-            log_extended_feedback(f"Set feeding_in_progress for plant {plant_ip}", plant_ip, status='info', sio=socketio_instance)
-        except Exception as e:
-            log_feeding_feedback(f"Failed to set feeding_in_progress for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
-            send_notification(f"Failed to set feeding_in_progress for plant {plant_ip}: {str(e)}")
-            message.append(f"Failed {plant_ip}: Set progress error")
-            if plant_ip in remaining_plants:
-                remaining_plants.remove(plant_ip)
-            continue
+            if not _post_feeding_status(resolved_plant_ip, plant_ip, True, sio=socketio_instance):
+                message.append(f"Failed {plant_ip}: Set progress error")
+                remaining_plants.pop(plant_ip, None)
+                return False
 
-        with current_app.config['plant_lock']:
-            plant_data = current_app.config['plant_data']
-            valve_info = plant_data.get(plant_ip, {}).get('valve_info', {})
-            drain_valve_ip = valve_info.get('drain_valve_ip')
-            drain_valve = valve_info.get('drain_valve')
-            drain_valve_label = valve_info.get('drain_valve_label')
-            fill_valve_ip = valve_info.get('fill_valve_ip')
-            fill_valve = valve_info.get('fill_valve')
-            fill_valve_label = valve_info.get('fill_valve_label')
-            water_level = plant_data.get(plant_ip, {}).get('water_level', {})
-            empty_sensor = settings.get('drain_sensor', 'sensor3')  # Assuming default
-            full_sensor = settings.get('fill_sensor', 'sensor1')    # Assuming default
+        # One lock-free snapshot of the payload serves the whole cycle.
+        valve_info = (plant_data.get(plant_ip) or {}).get('valve_info', {})
+        drain_valve_ip = valve_info.get('drain_valve_ip')
+        drain_valve = valve_info.get('drain_valve')
+        drain_valve_label = valve_info.get('drain_valve_label')
+        fill_valve_ip = valve_info.get('fill_valve_ip')
+        fill_valve = valve_info.get('fill_valve')
+        fill_valve_label = valve_info.get('fill_valve_label')
 
         if not drain_valve_ip or not drain_valve:
             log_feeding_feedback(f"No drain valve configured for plant {plant_ip}", plant_ip, status='error', sio=socketio_instance)
             send_notification(f"No drain valve configured for plant {plant_ip}")
-            message.append(f"Failed {plant_ip}: No drain valve")
-            if plant_ip in remaining_plants:
-                remaining_plants.remove(plant_ip)
-            try:
-                response = requests.post(f"http://{resolved_plant_ip}:8000/api/settings/feeding_status", json={"in_progress": False}, timeout=5)
-                response.raise_for_status()
-                log_extended_feedback(f"Reset feeding_in_progress for plant {plant_ip} due to error", plant_ip, status='info', sio=socketio_instance)
-            except Exception as e:
-                log_feeding_feedback(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
-                send_notification(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}")
-            continue
+            raise _AbortPlant("No drain valve")
 
         if not control_valve(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, 'on', sio=socketio_instance):
-            message.append(f"Failed {plant_ip}: Drain valve on error")
-            if plant_ip in remaining_plants:
-                remaining_plants.remove(plant_ip)
-            try:
-                response = requests.post(f"http://{resolved_plant_ip}:8000/api/settings/feeding_status", json={"in_progress": False}, timeout=5)
-                response.raise_for_status()
-                log_extended_feedback(f"Reset feeding_in_progress for plant {plant_ip} due to error", plant_ip, status='info', sio=socketio_instance)
-            except Exception as e:
-                log_feeding_feedback(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
-                send_notification(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}")
-            continue
+            raise _AbortPlant("Drain valve on error")
 
         log_feeding_feedback(f"Starting drain for plant {plant_ip}", plant_ip, status='info', sio=socketio_instance)
 
-        drain_monitor_thread = eventlet.spawn(monitor_drain_conditions, plant_ip, drain_valve_ip, drain_valve, drain_valve_label, settings, socketio_instance, current_app._get_current_object())  # Pass Flask app
+        # The monitor ends by itself on completion, failure, max_drain_time or stop
+        # (it watches stop_feeding_flag and _stop_event), so run it inline.
+        drain_result = _DrainResult()
+        monitor_drain_conditions(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, settings, socketio_instance, current_app._get_current_object(), drain_result, empty_sensor)
 
-        while not drain_complete['status']:
-            if stop_feeding_flag:
-                control_valve(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, 'off', sio=socketio_instance)
-                log_feeding_feedback(f"Interrupted drain for {plant_ip}", plant_ip, status='error', sio=socketio_instance)
-                send_notification(f"Interrupted drain for {plant_ip}")
-                message.append(f"Stopped {plant_ip}: Interrupted during drain")
-                try:
-                    response = requests.post(f"http://{resolved_plant_ip}:8000/api/settings/feeding_status", json={"in_progress": False}, timeout=5)
-                    response.raise_for_status()
-                    log_extended_feedback(f"Reset feeding_in_progress for plant {plant_ip} due to interruption", plant_ip, status='info', sio=socketio_instance)
-                except Exception as e:
-                    log_feeding_feedback(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
-                    send_notification(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}")
-                if plant_ip in remaining_plants:
-                    remaining_plants.remove(plant_ip)
-                break
-            time.sleep(1)
-            drain_monitor_thread.wait()
+        if stop_feeding_flag:
+            control_valve(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, 'off', sio=socketio_instance)
+            log_feeding_feedback(f"Interrupted drain for {plant_ip}", plant_ip, status='error', sio=socketio_instance)
+            send_notification(f"Interrupted drain for {plant_ip}")
+            raise _AbortPlant("Interrupted during drain", outcome='Stopped', reason='interruption')
 
-        if drain_complete['status']:
-            log_feeding_feedback(f"Drain complete for plant {plant_ip}. Reason: {drain_complete['reason']}", plant_ip, status='info', sio=socketio_instance)
+        if drain_result.status:
+            log_feeding_feedback(f"Drain complete for plant {plant_ip}. Reason: {drain_result.reason}", plant_ip, status='info', sio=socketio_instance)
         else:
-            log_feeding_feedback(f"Drain failed for plant {plant_ip}. Reason: {drain_complete['reason']}", plant_ip, status='error', sio=socketio_instance)
-            send_notification(f"Drain failed for plant {plant_ip}. Reason: {drain_complete['reason']}")
-            message.append(f"Failed {plant_ip}: Drain error")
+            log_feeding_feedback(f"Drain failed for plant {plant_ip}. Reason: {drain_result.reason}", plant_ip, status='error', sio=socketio_instance)
+            send_notification(f"Drain failed for plant {plant_ip}. Reason: {drain_result.reason}")
             control_valve(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, 'off', sio=socketio_instance)
-            if plant_ip in remaining_plants:
-                remaining_plants.remove(plant_ip)
-            try:
-                response = requests.post(f"http://{resolved_plant_ip}:8000/api/settings/feeding_status", json={"in_progress": False}, timeout=5)
-                response.raise_for_status()
-                log_extended_feedback(f"Reset feeding_in_progress for plant {plant_ip} due to error", plant_ip, status='info', sio=socketio_instance)
-            except Exception as e:
-                log_feeding_feedback(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
-                send_notification(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}")
-            continue
-
-        drain_complete = {'status': False, 'reason': None}  # Reset for next plant
+            raise _AbortPlant("Drain error")
 
         if not wait_for_valve_off(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, sio=socketio_instance):
             log_feeding_feedback(f"Failed to confirm drain valve {drain_valve_label} off for {plant_ip}", plant_ip, status='error', sio=socketio_instance)
             send_notification(f"Failed to confirm drain valve {drain_valve_label} off for {plant_ip}")
-            message.append(f"Failed {plant_ip}: Drain valve not off")
-            if plant_ip in remaining_plants:
-                remaining_plants.remove(plant_ip)
-            try:
-                response = requests.post(f"http://{resolved_plant_ip}:8000/api/settings/feeding_status", json={"in_progress": False}, timeout=5)
-                response.raise_for_status()
-                log_extended_feedback(f"Reset feeding_in_progress for plant {plant_ip} due to error", plant_ip, status='info', sio=socketio_instance)
-            except Exception as e:
-                log_feeding_feedback(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
-                send_notification(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}")
-            continue
+            raise _AbortPlant("Drain valve not off")
 
         log_extended_feedback(f"Drain complete for plant {plant_ip}. Drain valve confirmed off.", plant_ip, status='info', sio=socketio_instance)
 
-        with current_app.app_context():
-            current_app.config['current_feeding_phase'] = 'fill'
-            current_app.config['current_plant_ip'] = plant_ip
+        config['current_feeding_phase'] = 'fill'
+        config['current_plant_ip'] = plant_ip
 
         if not fill_valve_ip or not fill_valve:
             log_feeding_feedback(f"No fill valve configured for plant {plant_ip}", plant_ip, status='error', sio=socketio_instance)
             send_notification(f"No fill valve configured for plant {plant_ip}")
-            message.append(f"Failed {plant_ip}: No fill valve")
-            if plant_ip in remaining_plants:
-                remaining_plants.remove(plant_ip)
-            try:
-                response = requests.post(f"http://{resolved_plant_ip}:8000/api/settings/feeding_status", json={"in_progress": False}, timeout=5)
-                response.raise_for_status()
-                log_extended_feedback(f"Reset feeding_in_progress for plant {plant_ip} due to error", plant_ip, status='info', sio=socketio_instance)
-            except Exception as e:
-                log_feeding_feedback(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
-                send_notification(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}")
-            continue
+            raise _AbortPlant("No fill valve")
 
         if not control_valve(plant_ip, fill_valve_ip, fill_valve, fill_valve_label, 'on', sio=socketio_instance):
-            message.append(f"Failed {plant_ip}: Fill valve on error")
-            if plant_ip in remaining_plants:
-                remaining_plants.remove(plant_ip)
-            try:
-                response = requests.post(f"http://{resolved_plant_ip}:8000/api/settings/feeding_status", json={"in_progress": False}, timeout=5)
-                response.raise_for_status()
-                log_extended_feedback(f"Reset feeding_in_progress for plant {plant_ip} due to error", plant_ip, status='info', sio=socketio_instance)
-            except Exception as e:
-                log_feeding_feedback(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
-                send_notification(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}")
-            continue
+            raise _AbortPlant("Fill valve on error")
 
         log_feeding_feedback(f"Starting fill for plant {plant_ip}", plant_ip, status='info', sio=socketio_instance)
 
         if not full_sensor:
             log_feeding_feedback(f"No Full sensor configured for plant {plant_ip}", plant_ip, status='error', sio=socketio_instance)
             send_notification(f"No Full sensor configured for plant {plant_ip}")
-            message.append(f"Failed {plant_ip}: No Full sensor")
             control_valve(plant_ip, fill_valve_ip, fill_valve, fill_valve_label, 'off', sio=socketio_instance)
-            if plant_ip in remaining_plants:
-                remaining_plants.remove(plant_ip)
-            try:
-                response = requests.post(f"http://{resolved_plant_ip}:8000/api/settings/feeding_status", json={"in_progress": False}, timeout=5)
-                response.raise_for_status()
-                log_extended_feedback(f"Reset feeding_in_progress for plant {plant_ip} due to error", plant_ip, status='info', sio=socketio_instance)
-            except Exception as e:
-                log_feeding_feedback(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
-                send_notification(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}")
-            continue
+            raise _AbortPlant("No Full sensor")
         log_extended_feedback(f"Starting wait for Full sensor on {plant_ip}", plant_ip, status='info', sio=socketio_instance)
         if not wait_for_sensor(plant_ip, full_sensor, True, sio=socketio_instance):
             control_valve(plant_ip, fill_valve_ip, fill_valve, fill_valve_label, 'off', sio=socketio_instance)
             if stop_feeding_flag:
                 log_feeding_feedback(f"Stopped {plant_ip}: Interrupted during filling", plant_ip, status='error', sio=socketio_instance)
-                send_notification(f"Stopped {plant_ip}: Interrupted during filling. Completed: {', '.join(completed_plants) if completed_plants else 'None'}. Remaining: {', '.join(remaining_plants) if remaining_plants else 'None'}")
-                message.append(f"Stopped {plant_ip}: Interrupted during filling")
-                try:
-                    response = requests.post(f"http://{resolved_plant_ip}:8000/api/settings/feeding_status", json={"in_progress": False}, timeout=5)
-                    response.raise_for_status()
-                    log_extended_feedback(f"Reset feeding_in_progress for plant {plant_ip} due to interruption", plant_ip, status='info', sio=socketio_instance)
-                except Exception as e:
-                    log_feeding_feedback(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
-                    send_notification(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}")
+                send_notification(lambda: f"Stopped {plant_ip}: Interrupted during filling. Completed: {', '.join(completed_plants) if completed_plants else 'None'}. Remaining: {', '.join(remaining_plants) if remaining_plants else 'None'}")
                 stop_feeding_sequence()
-            else:
-                message.append(f"Failed {plant_ip}: Fill timeout or error")
-                if plant_ip in remaining_plants:
-                    remaining_plants.remove(plant_ip)
-                try:
-                    response = requests.post(f"http://{resolved_plant_ip}:8000/api/settings/feeding_status", json={"in_progress": False}, timeout=5)
-                    response.raise_for_status()
-                    log_extended_feedback(f"Reset feeding_in_progress for plant {plant_ip} due to error", plant_ip, status='info', sio=socketio_instance)
-                except Exception as e:
-                    log_feeding_feedback(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
-                    send_notification(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}")
-            continue
+                raise _AbortPlant("Interrupted during filling", outcome='Stopped', reason='interruption')
+            raise _AbortPlant("Fill timeout or error")
 
         # Emit fill_complete event when full sensor triggers
-        socketio_instance.emit('fill_complete', {'plant_ip': plant_ip}, namespace='/status')
+        _emit_status(socketio_instance, 'fill_complete', {'plant_ip': plant_ip})
         log_extended_feedback(f"Emitted fill_complete event for {plant_ip}", plant_ip, status='debug', sio=socketio_instance)
 
         if not wait_for_valve_off(plant_ip, fill_valve_ip, fill_valve, fill_valve_label, sio=socketio_instance):
             log_feeding_feedback(f"Failed to confirm fill valve {fill_valve_label} off for {plant_ip}", plant_ip, status='error', sio=socketio_instance)
             send_notification(f"Failed to confirm fill valve {fill_valve_label} off for {plant_ip}")
-            message.append(f"Failed {plant_ip}: Fill valve not turned off")
             control_valve(plant_ip, fill_valve_ip, fill_valve, fill_valve_label, 'off', sio=socketio_instance)
-            if plant_ip in remaining_plants:
-                remaining_plants.remove(plant_ip)
-            try:
-                response = requests.post(f"http://{resolved_plant_ip}:8000/api/settings/feeding_status", json={"in_progress": False}, timeout=5)
-                response.raise_for_status()
-                log_extended_feedback(f"Reset feeding_in_progress for plant {plant_ip} due to error", plant_ip, status='info', sio=socketio_instance)
-            except Exception as e:
-                log_feeding_feedback(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
-                send_notification(f"Failed to reset feeding_in_progress for plant {plant_ip}: {str(e)}")
-            continue
+            raise _AbortPlant("Fill valve not turned off")
         log_feeding_feedback(f"Fill complete for plant {plant_ip}. Fill valve confirmed off.", plant_ip, status='info', sio=socketio_instance)
 
-        with current_app.app_context():
-            current_app.config['current_feeding_phase'] = 'idle'
-            current_app.config['current_plant_ip'] = None
+        config['current_feeding_phase'] = 'idle'
+        config['current_plant_ip'] = None
 
         fresh_total = get_fresh_total_volume()
         feed_total = get_feed_total_volume()
@@ -644,28 +787,80 @@ def start_feeding_sequence(use_fresh=True, use_feed=True, sio=None):
 
         log_feeding_feedback(f"Completed full feeding cycle for plant {plant_ip}. Moving to next plant.", plant_ip, status='info', sio=socketio_instance)
         completed_plants.append(plant_ip)
-        if plant_ip in remaining_plants:
-            remaining_plants.remove(plant_ip)
+        remaining_plants.pop(plant_ip, None)
+        outcome = 'completed'
+        return True
+    except Exception as e:
+        # Anything unexpected (a dropped zone payload, a bug in the monitor) must
+        # still clear feeding_in_progress, or the zone stays locked in a feed.
+        if not isinstance(e, _AbortPlant):
+            log_feeding_feedback(f"Unexpected error feeding plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
+            send_notification(f"Unexpected error feeding plant {plant_ip}: {str(e)}")
+            e = _AbortPlant(f"Unexpected error: {str(e)}")
+        outcome = e.outcome.lower()
+        with feedback_batch(socketio_instance):
+            message.append(f"{e.outcome} {plant_ip}: {e.summary}")
+            remaining_plants.pop(plant_ip, None)
+            if resolved_plant_ip:
+                _reset_feeding_status_async(resolved_plant_ip, plant_ip, sio=socketio_instance, reason=e.reason)
+        return False
+    finally:
+        _emit_status(socketio_instance, 'feeding_plant_done', {'plant_ip': plant_ip, 'status': outcome})
+
+def start_feeding_sequence(use_fresh=True, use_feed=True, sio=None):
+    global stop_feeding_flag
+    stop_feeding_flag = False
+    _stop_event.clear()
+    _sequence_active.set()
+    config = current_app.config
+    config.update(_IDLE_STATE, feeding_sequence_active=True)
+    log_extended_feedback(f"Set feeding_sequence_active to True", status='debug')
+    socketio_instance = _get_socketio(sio)
+    _emit_status(socketio_instance, 'feeding_sequence_state', {'active': True})
+
+    settings = load_settings()
+    nutrient_concentration = settings.get('nutrient_concentration', 3)
+    print(f"[DEBUG] Loaded nutrient_concentration: {nutrient_concentration}")
+    
+    additional_plants = settings.get('additional_plants', [])
+    log_feeding_feedback(f"Starting feeding sequence with use_fresh={use_fresh}, use_feed={use_feed}. Plants: {additional_plants}", status='info', sio=socketio_instance)
+
+    # Insertion-ordered, so the notifications list plants in sequence order, and
+    # _feed_one_plant drops a plant with one O(1) pop instead of a scan + remove.
+    remaining_plants = dict.fromkeys(additional_plants)
+    completed_plants = []
+    message = []
+    had_empty = False
+
+    for plant_ip in additional_plants:
+        if stop_feeding_flag:
+            log_feeding_feedback(f"Stopping sequence early due to interruption. Completed: {', '.join(completed_plants) if completed_plants else 'None'}. Remaining: {', '.join(remaining_plants) if remaining_plants else 'None'}", status='error', sio=socketio_instance)
+            send_notification(lambda: f"Stopping sequence early due to interruption. Completed: {', '.join(completed_plants) if completed_plants else 'None'}. Remaining: {', '.join(remaining_plants) if remaining_plants else 'None'}")
+            break
+
+        if not _feed_one_plant(plant_ip, settings, socketio_instance, message, remaining_plants, completed_plants):
+            continue
 
         # Check feed level after completing the current plant, before moving to the next one
         if use_feed and not had_empty:
             feed_level = get_feed_level()
             if feed_level == 'Empty':
                 log_feeding_feedback(f"Feed reservoir ran out after completing plant {plant_ip}. Stopping feeding sequence.", plant_ip, status='error', sio=socketio_instance)
-                send_notification(f"Feed reservoir ran out after completing plant {plant_ip}. Completed: {', '.join(completed_plants) if completed_plants else 'None'}. Remaining: {', '.join(remaining_plants) if remaining_plants else 'None'}")
+                send_notification(lambda: f"Feed reservoir ran out after completing plant {plant_ip}. Completed: {', '.join(completed_plants) if completed_plants else 'None'}. Remaining: {', '.join(remaining_plants) if remaining_plants else 'None'}")
                 message.append(f"Stopped after {plant_ip}: Feed reservoir empty")
                 stop_feeding_sequence()
                 break
 
-    with current_app.app_context():
-        current_app.config['feeding_sequence_active'] = False
-        current_app.config['current_feeding_phase'] = 'idle'
-        current_app.config['current_plant_ip'] = None
-        log_extended_feedback(f"Set feeding_sequence_active to False", status='debug')
-    socketio_instance.emit('feeding_sequence_state', {'active': False}, namespace='/status')
+    while _pending_resets:
+        _pending_resets.pop().wait()
+
+    config.update(_IDLE_STATE)
+    _sequence_active.clear()
+    log_extended_feedback(f"Set feeding_sequence_active to False", status='debug')
+    _emit_status(socketio_instance, 'feeding_sequence_state', {'active': False})
     if not stop_feeding_flag:
         log_feeding_feedback(f"Completed full feeding cycle for all plants.", status='info', sio=socketio_instance)
-        send_notification(f"Completed full feeding cycle for all plants: {'; '.join(message) if message else 'All plants processed successfully'}. Completed: {', '.join(completed_plants) if completed_plants else 'None'}. Remaining: {', '.join(remaining_plants) if remaining_plants else 'None'}")
+        send_notification(lambda: f"Completed full feeding cycle for all plants: {'; '.join(message) if message else 'All plants processed successfully'}. Completed: {', '.join(completed_plants) if completed_plants else 'None'}. Remaining: {', '.join(remaining_plants) if remaining_plants else 'None'}")
     else:
         log_feeding_feedback(f"Feeding sequence terminated early.", status='info', sio=socketio_instance)
 
@@ -673,100 +868,147 @@ def start_feeding_sequence(use_fresh=True, use_feed=True, sio=None):
         message.append("No eligible plants processed")
     return "Feeding sequence completed: " + "; ".join(message)
 
+def _emit_stop_feeding(targets, socketio_instance):
+    """
+    Send stop_feeding to every zone in one pass. Each zone is a separate server
+    reached through its own client socket, so there is no room to broadcast to;
+    doing all emits before any valve HTTP at least gets every zone stopping at once.
+    """
+    with feedback_batch(socketio_instance):
+        for plant_ip, client, _ in targets:
+            try:
+                client.emit('stop_feeding', namespace='/status')
+                log_extended_feedback(f"Emitted stop_feeding for plant {plant_ip}", plant_ip, status='success', sio=socketio_instance)
+            except Exception as e:
+                log_feeding_feedback(f"Failed to emit stop_feeding for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
+                send_notification(f"Failed to emit stop_feeding for plant {plant_ip}: {str(e)}")
+
+def _is_on(valve_relays, label):
+    """True if valve_relays reports label as on; a missing entry counts as off."""
+    entry = valve_relays.get(label)
+    return entry is not None and entry.get('status') == 'on'
+
+def _valves_on(valve_info):
+    """
+    Reduce a zone's valve_info payload to the valves a stop must turn off, as
+    (kind, valve_ip, valve_id, valve_label) tuples. valve_info stays a plain dict
+    because it is broadcast to the dashboard as-is; only the stop snapshot is compact.
+    """
+    valve_relays = valve_info.get('valve_relays') or {}
+    actions = []
+    for kind in ('drain', 'fill'):
+        valve_ip = valve_info.get(f'{kind}_valve_ip')
+        valve_id = valve_info.get(f'{kind}_valve')
+        valve_label = valve_info.get(f'{kind}_valve_label')
+        if valve_ip and valve_id and _is_on(valve_relays, valve_label):
+            actions.append((kind, valve_ip, valve_id, valve_label))
+    return tuple(actions)
+
+def _stop_one_plant(plant_ip, actions, socketio_instance, app):
+    """Turn off the valves stop_feeding_sequence found on for one zone (see
+    _valves_on). Runs in its own green thread, so it pushes its own app context."""
+    with app.app_context(), feedback_batch(socketio_instance):
+        resolved_plant_ip = standardize_host_ip(plant_ip)
+        if not resolved_plant_ip:
+            log_feeding_feedback(f"Failed to resolve plant IP {plant_ip} for stop", plant_ip, status='error', sio=socketio_instance)
+            send_notification(f"Failed to resolve plant IP {plant_ip} for stop")
+            return None
+
+        def turn_off(kind, valve_ip, valve_id, valve_label):
+            with app.app_context():
+                control_valve(plant_ip, valve_ip, valve_id, valve_label, 'off', sio=socketio_instance)
+                log_extended_feedback(f"Turned off {kind} valve {valve_id} ({valve_label}) for plant {plant_ip}", plant_ip, status='success', sio=socketio_instance)
+
+        # Drain and fill are different relays with no ordering between two "off"s,
+        # so send both at once.
+        for thread in [eventlet.spawn(turn_off, *action) for action in actions]:
+            thread.wait()
+
+        return f"Stopped {plant_ip}"
+
 def stop_feeding_sequence():
     """Stop the feeding sequence by emitting stop_feeding and turning off active valves."""
     global stop_feeding_flag
-    if current_app.config.get('feeding_sequence_active', False):
+    app = current_app._get_current_object()
+    config = app.config
+    if config.get('feeding_sequence_active', False):
         stop_feeding_flag = True
-        with current_app.app_context():
-            current_app.config['feeding_sequence_active'] = False
-            current_app.config['current_feeding_phase'] = 'idle'
-            current_app.config['current_plant_ip'] = None
-            log_extended_feedback(f"Set feeding_sequence_active to False in stop_feeding_sequence", status='debug')
-        plant_clients = current_app.config.get('plant_clients', {})
-        plants_data = current_app.config.get('plant_data', {})
+        _stop_event.set()
+        _sequence_active.clear()
+        _wake_all_waiters()
+        config.update(_IDLE_STATE)
+        log_extended_feedback(f"Set feeding_sequence_active to False in stop_feeding_sequence", status='debug')
+        plant_clients = config.get('plant_clients') or {}
         message = []
 
-        socketio_instance = current_app.config.get('socketio') or current_app.extensions.get('socketio')
+        socketio_instance = _get_socketio()
         log_feeding_feedback("Stopping feeding sequence for all plants", status='info', sio=socketio_instance)
         send_notification("Stopping feeding sequence for all plants")
-        socketio_instance.emit('feeding_sequence_state', {'active': False}, namespace='/status')
-
-        # Clean up local relays and pump
-        from utils.settings_utils import load_settings
-        from services.feed_pump_service import control_feed_pump
-        settings = load_settings()
-        feed_relay = settings.get('relay_ports', {}).get('feed_water')
-        fresh_relay = settings.get('relay_ports', {}).get('fresh_water')
 
-        def control_local_relay(relay_id, action, sio=None, plant_ip=None, status='info'):
-            url = f"http://127.0.0.1:8000/api/valve_relay/{relay_id}/{action}"
-            try:
-                response = requests.post(url, timeout=5)
-                response.raise_for_status()
-                data = response.json()
-                if data.get('status') == 'success':
-                    log_feeding_feedback(f"Local relay {relay_id} turned {action}", plant_ip, status, sio)
-                    return True
-                else:
-                    log_feeding_feedback(f"Failed to turn {action} local relay {relay_id}: {data.get('error')}", plant_ip, 'error', sio)
-                    send_notification(f"Failed to turn {action} local relay {relay_id}: {data.get('error')}")
+        # The dashboard flips to idle only once the shutdown has actually run, and
+        # exactly once even if a step below raises.
+        result = "Feeding stopped: No plants were active"
+        try:
+            # Clean up local relays and pump
+            from utils.settings_utils import load_settings
+            from services.feed_pump_service import control_feed_pump
+            settings = load_settings()
+            feed_relay = settings.get('relay_ports', {}).get('feed_water')
+            fresh_relay = settings.get('relay_ports', {}).get('fresh_water')
+
+            def control_local_relay(relay_id, action, sio=None, plant_ip=None, status='info'):
+                url = f"http://127.0.0.1:8000/api/valve_relay/{relay_id}/{action}"
+                try:
+                    response = _session.post(url, timeout=5)
+                    response.raise_for_status()
+                    data = parse_relay_response(response)
+                    if data.get('status') == 'success':
+                        log_feeding_feedback(f"Local relay {relay_id} turned {action}", plant_ip, status, sio)
+                        return True
+                    else:
+                        log_feeding_feedback(f"Failed to turn {action} local relay {relay_id}: {data.get('error')}", plant_ip, 'error', sio)
+                        send_notification(f"Failed to turn {action} local relay {relay_id}: {data.get('error')}")
+                        return False
+                except Exception as e:
+                    log_feeding_feedback(f"Error controlling local relay {relay_id}: {str(e)}", plant_ip, 'error', sio)
+                    send_notification(f"Error controlling local relay {relay_id}: {str(e)}")
                     return False
-            except Exception as e:
-                log_feeding_feedback(f"Error controlling local relay {relay_id}: {str(e)}", plant_ip, 'error', sio)
-                send_notification(f"Error controlling local relay {relay_id}: {str(e)}")
-                return False
-
-        if feed_relay:
-            control_local_relay(feed_relay, 'off', socketio_instance)
-        if fresh_relay:
-            control_local_relay(fresh_relay, 'off', socketio_instance)
-        control_feed_pump(state=0)
-        log_feeding_feedback("Turned off local feed pump and relays", status='info', sio=socketio_instance)
-
-        # Snapshot: the connection watchdog can add or retire clients concurrently.
-        for plant_ip in list(plant_clients.keys()):
-            client = plant_clients.get(plant_ip)
-            if client is None or not client.connected:
-                continue
-
-            resolved_plant_ip = standardize_host_ip(plant_ip)
-            if not resolved_plant_ip:
-                log_feeding_feedback(f"Failed to resolve plant IP {plant_ip} for stop", plant_ip, status='error', sio=socketio_instance)
-                send_notification(f"Failed to resolve plant IP {plant_ip} for stop")
-                continue
-
-            try:
-                plant_clients[plant_ip].emit('stop_feeding', namespace='/status')
-                log_extended_feedback(f"Emitted stop_feeding for plant {plant_ip}", plant_ip, status='success', sio=socketio_instance)
-            except Exception as e:
-                log_feeding_feedback(f"Failed to emit stop_feeding for plant {plant_ip}: {str(e)}", plant_ip, status='error', sio=socketio_instance)
-                send_notification(f"Failed to emit stop_feeding for plant {plant_ip}: {str(e)}")
 
-            with current_app.config['plant_lock']:
-                plant_data = plants_data.get(plant_ip, {})
-                valve_info = plant_data.get('valve_info', {})
-                drain_valve_ip = valve_info.get('drain_valve_ip')
-                drain_valve = valve_info.get('drain_valve')
-                drain_valve_label = valve_info.get('drain_valve_label')
-                fill_valve_ip = valve_info.get('fill_valve_ip')
-                fill_valve = valve_info.get('fill_valve')
-                fill_valve_label = valve_info.get('fill_valve_label')
-                valve_relays = valve_info.get('valve_relays', {})
-
-            if drain_valve_ip and drain_valve and valve_relays.get(drain_valve_label, {}).get('status') == 'on':
-                control_valve(plant_ip, drain_valve_ip, drain_valve, drain_valve_label, 'off', sio=socketio_instance)
-                log_extended_feedback(f"Turned off drain valve {drain_valve} ({drain_valve_label}) for plant {plant_ip}", plant_ip, status='success', sio=socketio_instance)
-
-            if fill_valve_ip and fill_valve and valve_relays.get(fill_valve_label, {}).get('status') == 'on':
-                control_valve(plant_ip, fill_valve_ip, fill_valve, fill_valve_label, 'off', sio=socketio_instance)
-                log_extended_feedback(f"Turned off fill valve {fill_valve} ({fill_valve_label}) for plant {plant_ip}", plant_ip, status='success', sio=socketio_instance)
-
-            message.append(f"Stopped {plant_ip}")
-
-        if not message:
-            message.append("No plants were active")
-        return "Feeding stopped: " + "; ".join(message)
+            if feed_relay:
+                control_local_relay(feed_relay, 'off', socketio_instance)
+            if fresh_relay:
+                control_local_relay(fresh_relay, 'off', socketio_instance)
+            control_feed_pump(state=0)
+            log_feeding_feedback("Turned off local feed pump and relays", status='info', sio=socketio_instance)
+
+            # No zone clients means nothing to stop remotely (the common case after a
+            # clean run); the local relays and pump above are still always turned off.
+            if plant_clients:
+                # Snapshot (ip, client) pairs in one pass: the connection watchdog can add or
+                # retire clients concurrently, and a copied pair needs no re-lookup.
+                # valve_info is read lock-free: status_update swaps whole payloads (see
+                # _sensor_reader), so each read is one consistent payload.
+                plant_data = config['plant_data']
+                targets = []
+                for plant_ip, client in list(plant_clients.items()):
+                    if client.connected:
+                        valve_info = (plant_data.get(plant_ip) or {}).get('valve_info') or {}
+                        targets.append((plant_ip, client, _valves_on(valve_info)))
+
+                # Each plant's valves are independent, so stop them all at once: wall time is
+                # the slowest plant rather than the sum of every plant's valve round-trips.
+                if targets:
+                    _emit_stop_feeding(targets, socketio_instance)
+                    pool = eventlet.GreenPool(size=min(STOP_POOL_SIZE, len(targets)))
+                    for stopped in pool.imap(lambda target: _stop_one_plant(target[0], target[2], socketio_instance, app), targets):
+                        if stopped:
+                            message.append(stopped)
+
+            if message:
+                result = "Feeding stopped: " + "; ".join(message)
+        finally:
+            _emit_status(socketio_instance, 'feeding_sequence_state', {'active': False, 'stopped': result})
+        return result
     else:
         log_extended_feedback("Stop feeding sequence called but sequence already stopped", status='debug')
         return "Feeding sequence already stopped"
@@ -2,6 +2,8 @@
 import json
 import os
 import time
+import eventlet
+import eventlet.queue
 from datetime import datetime, timedelta
 
 # Define the log directory and file
@@ -13,6 +15,12 @@ LOG_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'logs')
 LOG_RETENTION_DAYS = 14
 PRUNE_INTERVAL_SECONDS = 24 * 3600
 
+# Background writer for hot-path logging. Entries queued within this window are
+# written with one open/write per category instead of one per entry.
+WRITE_FLUSH_INTERVAL = 0.2
+_write_queue = eventlet.queue.LightQueue()
+_writer = None
+
 def ensure_log_dir_exists():
     """
     Ensures the log directory exists.
@@ -109,10 +117,64 @@ def prune_logs_daily():
 def log_event(data_dict, category='general'):
     log_file = os.path.join(LOG_DIR, f'{category}_log.jsonl')
     ensure_log_dir_exists()
-    data_dict['timestamp'] = datetime.now().isoformat()
+    # Feedback callers already stamp the entry they emit to the UI; reuse it so
+    # the disk line matches the UI and isoformat() runs once per message.
+    if 'timestamp' not in data_dict:
+        data_dict['timestamp'] = datetime.now().isoformat()
     with open(log_file, 'a') as f:
         f.write(json.dumps(data_dict) + '\n')
 
+def log_events(entries, category='general'):
+    """
+    Append several entries to one log in a single open/write. Each entry keeps
+    its own line, so readers see the same JSONL as repeated log_event calls.
+    Entries buffered before the write keep the timestamp they were created with.
+    """
+    if not entries:
+        return
+    log_file = os.path.join(LOG_DIR, f'{category}_log.jsonl')
+    ensure_log_dir_exists()
+    timestamp = datetime.now().isoformat()
+    lines = []
+    for data_dict in entries:
+        if 'timestamp' not in data_dict:
+            data_dict['timestamp'] = timestamp
+        lines.append(json.dumps(data_dict) + '\n')
+    with open(log_file, 'a') as f:
+        f.write(''.join(lines))
+
+def queue_log_events(entries, category='general'):
+    """
+    Hand entries to the background writer and return without touching disk.
+    Timestamps are stamped here so they reflect when the event happened, not
+    when the writer got to it.
+    """
+    global _writer
+    if not entries:
+        return
+    timestamp = datetime.now().isoformat()
+    for data_dict in entries:
+        data_dict.setdefault('timestamp', timestamp)
+    if _writer is None:
+        _writer = eventlet.spawn(_log_writer)
+    _write_queue.put((category, entries))
+
+def _log_writer():
+    """Drain _write_queue, grouping each flush window per category (order kept)."""
+    while True:
+        pending = [_write_queue.get()]
+        eventlet.sleep(WRITE_FLUSH_INTERVAL)
+        while not _write_queue.empty():
+            pending.append(_write_queue.get_nowait())
+        by_category = {}
+        for category, entries in pending:
+            by_category.setdefault(category, []).extend(entries)
+        for category, entries in by_category.items():
+            try:
+                log_events(entries, category=category)
+            except Exception as e:
+                print(f"[LOG] Failed to write {len(entries)} {category} entries: {e}")
+
 def log_reset_event(sensor, previous_total):
     """
     Logs a reset event for a flow sensor (flow meter logs).
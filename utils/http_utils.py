@@ -0,0 +1,45 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled session shared by every service that talks to a zone, valve relay,
+# local relay API or Shelly. Keep-alive connections are reused per host instead of
+# opening a new socket per request. Valve on/off, feeding_status and Shelly
+# relay calls are idempotent, so retrying them on a gateway error is safe.
+# Read timeouts are not retried: a hung zone would otherwise cost a full read
+# timeout per attempt, on top of the callers' own retry loops.
+#
+# Every peer is on the LAN, where a TCP connect either completes in milliseconds
+# or the host is down. A plain `timeout=N` is therefore split into a
+# CONNECT_TIMEOUT connect budget plus N for the read, so an offline zone costs
+# about a second per attempt instead of the whole read timeout. Retries use no
+# backoff for the same reason.
+CONNECT_TIMEOUT = 1.0
+
+class _Session(requests.Session):
+    def request(self, method, url, *args, timeout=None, **kwargs):
+        if isinstance(timeout, (int, float)):
+            timeout = (min(CONNECT_TIMEOUT, timeout), timeout)
+        return super().request(method, url, *args, timeout=timeout, **kwargs)
+
+session = _Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, read=0, backoff_factor=0, status_forcelist=[502, 503, 504], allowed_methods=None),
+)
+session.mount('http://', _adapter)
+
+_SUCCESS_MARKERS = (b'"status":"success"', b'"status": "success"')
+
+def parse_relay_response(response):
+    """
+    Decode a valve relay reply. Relays answer {"status": "success", ...} on the
+    happy path, so recognise that without a JSON decode (a quoted marker inside an
+    error string would be escaped, so it can't false-match). Anything else -
+    failures carry an 'error' field the caller reports - is parsed in full.
+    """
+    content = response.content
+    if any(marker in content for marker in _SUCCESS_MARKERS):
+        return {'status': 'success'}
+    return response.json()
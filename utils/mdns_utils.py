@@ -1,6 +1,7 @@
 import socket
 import subprocess
 import time
+import eventlet
 from utils.settings_utils import load_settings
 import logging
 import os
@@ -24,11 +25,27 @@ def _cache_get(hostname):
     return False, None
 
 
+_REFRESHING = set()         # keys with a background refresh in flight
+
+
+def _cache_get_stale(hostname):
+    """Return an expired-but-successful entry's IP, or None."""
+    entry = _RESOLVE_CACHE.get(hostname)
+    return entry[0] if entry else None
+
+
 def _cache_put(hostname, ip):
     ttl = _RESOLVE_TTL_OK if ip else _RESOLVE_TTL_FAIL
     _RESOLVE_CACHE[hostname] = (ip, time.time() + ttl)
     return ip
 
+def clear_resolve_cache():
+    """Forget every cached resolution, e.g. after zones were renumbered. Returns
+    how many entries were dropped."""
+    count = len(_RESOLVE_CACHE)
+    _RESOLVE_CACHE.clear()
+    return count
+
 def get_local_ip_address():
     """
     Return this Pi’s primary LAN IP, or '127.0.0.1' on fallback.
@@ -157,6 +174,37 @@ def standardize_host_ip(raw_host_ip: str) -> str:
             logger.debug("raw_host_ip is empty, returning None")
         return None
 
+    # Whole-result cache in front of the settings reads and the local-IP probe,
+    # which otherwise run on every valve call even when the mDNS lookup is cached.
+    key = ('standardized', raw_host_ip)
+    cached, cached_ip = _cache_get(key)
+    if cached:
+        return cached_ip
+    # Known host past its TTL: serve the last good IP and re-resolve in the
+    # background, so a valve call or stop never waits on avahi for a host we know.
+    # A failed refresh drops the entry, so stale IPs live at most one refresh.
+    stale_ip = _cache_get_stale(key)
+    if stale_ip:
+        if key not in _REFRESHING:
+            _REFRESHING.add(key)
+            eventlet.spawn(_refresh_standardized, key, raw_host_ip)
+        return stale_ip
+    return _cache_put(key, _standardize_host_ip(raw_host_ip))
+
+def _refresh_standardized(key, raw_host_ip):
+    try:
+        ip = _standardize_host_ip(raw_host_ip)
+        if ip:
+            _cache_put(key, ip)
+        else:
+            # The host stopped resolving (offline, or renumbered by DHCP). Forget
+            # the old IP so the next caller resolves synchronously and sees the
+            # failure instead of sending traffic to an address that may be gone.
+            _RESOLVE_CACHE.pop(key, None)
+    finally:
+        _REFRESHING.discard(key)
+
+def _standardize_host_ip(raw_host_ip: str) -> str:
     settings = load_settings()
     system_name = settings.get("system_name", "Garden").lower()
     lower_host = raw_host_ip.lower()